@@ -21,6 +21,7 @@ class YncaConnectionMock(mock.MagicMock):
         # Need to separate from __init__ otherwise it would run into infinite
         # recursion when executing `self.get.side_effect = xyz`
         self.get.side_effect = self._get_response
+        self.get_batch.side_effect = self._get_batch_response
         self._get_response_list_offset = 0
 
     def _get_response(self, subunit, function):
@@ -45,6 +46,10 @@ class YncaConnectionMock(mock.MagicMock):
         except Exception as e:
             print(f"Skipping: {subunit}, {function} because of {e}")
 
+    def _get_batch_response(self, requests):
+        for subunit, function in requests:
+            self._get_response(subunit, function)
+
     def send_protocol_message(self, subunit, function, value=None):
         for callback in self.register_message_callback.call_args.args:
             callback(YncaProtocolStatus.OK, subunit, function, value)
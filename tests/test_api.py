@@ -6,7 +6,7 @@ from ynca.subunits.bt import Bt
 from ynca.errors import YncaConnectionError, YncaInitializationFailedException
 from ynca.subunits.usb import Usb
 from ynca.subunits.system import System
-from ynca.subunits.zone import Main
+from ynca.subunits.zone import ZoneBase
 
 SYS = "SYS"
 MAIN = "MAIN"
@@ -78,127 +78,127 @@ INITIALIZE_MINIMAL_RESPONSES = [
 ]
 
 
-INITIALIZE_FULL_RESPONSES = [
+INITIALIZE_FULL_RESPONSES = (
     (
         (SYS, "AVAIL"),
-        [
+        (
             (RESTRICTED, None, None),
-        ],
+        ),
     ),
     (
         (MAIN, "AVAIL"),
-        [
+        (
             (MAIN, "AVAIL", "Not Ready"),
-        ],
+        ),
     ),
     (
         (ZONE4, "AVAIL"),
-        [
+        (
             (RESTRICTED, None, None),
-        ],
+        ),
     ),
     (
         (BT, "AVAIL"),
-        [
+        (
             (BT, "AVAIL", "Not Connected"),
-        ],
+        ),
     ),
     (
         (USB, "AVAIL"),
-        [
+        (
             (USB, "AVAIL", "Not Connected"),
-        ],
+        ),
     ),
     # Receiver detect subunits sync
     (
         (SYS, "VERSION"),
-        [
+        (
             (SYS, "VERSION", "Version"),
-        ],
+        ),
     ),
     # SYS Subunit init start
     (
         (SYS, "AVAIL"),
-        [
+        (
             (RESTRICTED, None, None),
-        ],
+        ),
     ),
     (
         (SYS, "INPNAME"),
-        [
+        (
             (SYS, "INPNAMEHDMI1", "InputHdmi1One"),
             (SYS, "INPNAMEUSB", "InputUsb"),
             (SYS, "INPNAMEUNKNOWN", "InputUnknown"),
-        ],
+        ),
     ),
     (
         (SYS, "MODELNAME"),
-        [
+        (
             (SYS, "MODELNAME", "ModelName"),
-        ],
+        ),
     ),
     (
         (SYS, "PWR"),
-        [
+        (
             (SYS, "PWR", "Standby"),
-        ],
+        ),
     ),
     # SYS Subunit initialize sync
     (
         (SYS, "VERSION"),
-        [
+        (
             (SYS, "VERSION", "Version"),
-        ],
+        ),
     ),
     # BT Subunit init start
     (
         (BT, "AVAIL"),
-        [
+        (
             (BT, "AVAIL", "Not Connected"),
-        ],
+        ),
     ),
     # BT Subunit initialize sync
     (
         (SYS, "VERSION"),
-        [
+        (
             (SYS, "VERSION", "Version"),
-        ],
+        ),
     ),
     # MAIN Subunit init start
     (
         (MAIN, "AVAIL"),
-        [
+        (
             (MAIN, "AVAIL", "Not Ready"),
-        ],
+        ),
     ),
     (
         (MAIN, "ZONENAME"),
-        [
+        (
             (MAIN, "ZONENAME", "MainZoneName"),
-        ],
+        ),
     ),
     # MAIN Subunit iniatilize sync
     (
         (SYS, "VERSION"),
-        [
+        (
             (SYS, "VERSION", "Version"),
-        ],
+        ),
     ),
     # USB Subunit init start
     (
         (USB, "AVAIL"),
-        [
+        (
             (USB, "AVAIL", "Not Connected"),
-        ],
+        ),
     ),
     # USB Subunit iniatilize sync
     (
         (SYS, "VERSION"),
-        [
+        (
             (SYS, "VERSION", "Version"),
-        ],
+        ),
     ),
-]
+)
 
 
 def test_construct():
@@ -335,9 +335,11 @@ def test_initialize_fail(connection):
 
         disconnect_callback = mock.MagicMock()
 
-        y = ynca.YncaApi("serial_url", disconnect_callback)
-        with pytest.raises(YncaInitializationFailedException):
-            y.initialize()
+        # Shorten the timeout to keep the test fast
+        with mock.patch.object(ynca.api, "SUBUNIT_AVAILABILITY_CHECK_TIMEOUT", 1):
+            y = ynca.YncaApi("serial_url", disconnect_callback)
+            with pytest.raises(YncaInitializationFailedException):
+                y.initialize()
 
         connection.close.assert_called_once()
         disconnect_callback.assert_not_called()
@@ -418,7 +420,8 @@ def test_initialize_full(connection):
         assert y.sys.version == "Version"
         assert y.sys.inpnameusb == "InputUsb"
 
-        assert isinstance(y.main, Main)
+        assert isinstance(y.main, ZoneBase)
+        assert y.main.id == MAIN
         assert y.main.zonename == "MainZoneName"
         assert isinstance(y.bt, Bt)
         assert isinstance(y.usb, Usb)
@@ -263,3 +263,51 @@ def test_keep_alive(mock_serial):
         assert message_callback.call_args == mock.call(
             YncaProtocolStatus.OK, "SYS", "MODELNAME", "TESTMODEL"
         )
+
+
+def test_send_get_batch(mock_serial):
+
+    with active_connection(mock_serial) as connection:
+        raw_data_1 = mock_serial.stub(
+            receive_bytes=b"@Subunit1:Function1=?\r\n", send_bytes=b""
+        )
+        raw_data_2 = mock_serial.stub(
+            receive_bytes=b"@Subunit2:Function2=?\r\n", send_bytes=b""
+        )
+
+        connection.get_batch([("Subunit1", "Function1"), ("Subunit2", "Function2")])
+        assert connection.num_commands_sent == 2
+
+    assert raw_data_1.calls == 1
+    assert raw_data_2.calls == 1
+
+
+def test_connect_low_latency_mode(mock_serial):
+
+    keep_alive = mock_serial.stub(
+        receive_bytes=b"@SYS:MODELNAME=?\r\n",
+        send_bytes=b"@SYS:MODELNAME=TESTMODEL\r\n",
+    )
+
+    with mock.patch(
+        "serial.Serial.set_low_latency_mode", create=True
+    ) as set_low_latency_mode:
+        connection = YncaConnection(mock_serial.port)
+        connection.connect()
+        set_low_latency_mode.assert_called_once_with(True)
+
+        time.sleep(SHORT_DELAY)
+        connection.close()
+
+
+def test_close_drops_pending_get_batch(mock_serial):
+
+    with active_connection(mock_serial, delay_after_close=0) as connection:
+        connection.get_batch([])
+        connection.get_batch([("Subunit", f"Function{i}") for i in range(30)])
+        assert connection.num_commands_sent == 30
+
+        start = time.time()
+        connection.close()
+        # Pending requests are dropped, so no need to wait for them to be sent
+        assert time.time() - start < 1
@@ -83,6 +83,10 @@ def test_initialize(connection, update_callback):
     assert dmps.song == "Song"
     assert dmps.playbackinfo is PlaybackInfo.PAUSE
 
+    # Functions sharing METAINFO as initializer result in only one request
+    requests = connection.get_batch.call_args.args[0]
+    assert requests.count((SUBUNIT, "METAINFO")) == 1
+
     dmps.repeat = Repeat.ALL
     connection.put.assert_called_with(SUBUNIT, "REPEAT", "All")
     dmps.shuffle = Shuffle.OFF
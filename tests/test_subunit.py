@@ -80,6 +80,11 @@ def test_initialize(connection, update_callback):
     assert update_callback.call_count == 0
     assert dsu.avail == Avail.READY
 
+    # Function initialization requests are sent as one batch
+    connection.get_batch.assert_called_once_with(
+        [(SUBUNIT, "AVAIL"), (SUBUNIT, "DUMMY_FUNCTION")]
+    )
+
 
 def test_registration(connection, initialized_dummysubunit: SubunitBase):
 
@@ -14,7 +14,8 @@ from ynca import (
     Straight,
     TwoChDecoder,
 )
-from ynca.subunits.zone import Main, ZoneBase
+from ynca.constants import Subunit
+from ynca.subunits.zone import ZoneBase
 
 from .mock_yncaconnection import YncaConnectionMock
 
@@ -99,19 +100,25 @@ def update_callback() -> Callable[[], None]:
 @pytest.fixture
 def initialized_zone(connection) -> ZoneBase:
     connection.get_response_list = INITIALIZE_FULL_RESPONSES
-    z = Main(connection)
+    z = ZoneBase(connection, id=SUBUNIT)
     z.initialize()
     return z
 
 
 def test_construct(connection, update_callback):
 
-    Main(connection)
+    ZoneBase(connection, id=SUBUNIT)
 
     assert connection.register_message_callback.call_count == 1
     assert update_callback.call_count == 0
 
 
+def test_construct_invalid_id(connection):
+
+    with pytest.raises(ValueError):
+        ZoneBase(connection, id=Subunit.USB)
+
+
 def test_initialize_minimal(connection, update_callback):
     connection.get_response_list = [
         (
@@ -128,7 +135,7 @@ def test_initialize_minimal(connection, update_callback):
         ),
     ]
 
-    z = Main(connection)
+    z = ZoneBase(connection, id=SUBUNIT)
     z.register_update_callback(update_callback)
     z.unregister_update_callback(update_callback)
 
@@ -153,7 +160,7 @@ def test_initialize_full(connection, update_callback):
 
     connection.get_response_list = INITIALIZE_FULL_RESPONSES
 
-    z = Main(connection)
+    z = ZoneBase(connection, id=SUBUNIT)
     z.register_update_callback(update_callback)
 
     z.initialize()
@@ -225,6 +232,8 @@ def test_volume(connection, initialized_zone: ZoneBase):
     connection.put.assert_called_with(SUBUNIT, "VOL", "Up 2 dB")
     initialized_zone.vol_up(5)
     connection.put.assert_called_with(SUBUNIT, "VOL", "Up 5 dB")
+    initialized_zone.vol_up(2.0)
+    connection.put.assert_called_with(SUBUNIT, "VOL", "Up 2 dB")
     initialized_zone.vol_up(50)
     connection.put.assert_called_with(SUBUNIT, "VOL", "Up")
 
@@ -237,6 +246,8 @@ def test_volume(connection, initialized_zone: ZoneBase):
     connection.put.assert_called_with(SUBUNIT, "VOL", "Down 2 dB")
     initialized_zone.vol_down(5)
     connection.put.assert_called_with(SUBUNIT, "VOL", "Down 5 dB")
+    initialized_zone.vol_down(2.0)
+    connection.put.assert_called_with(SUBUNIT, "VOL", "Down 2 dB")
     initialized_zone.vol_down(50)
     connection.put.assert_called_with(SUBUNIT, "VOL", "Down")
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import functools
 import logging
+import queue
 import threading
 from typing import Callable, Dict, List, Optional, Set, cast
 
 from .connection import YncaConnection, YncaProtocol, YncaProtocolStatus
 from .constants import Subunit
 from .errors import YncaConnectionError, YncaInitializationFailedException
-from .helpers import all_subclasses
 from .subunit import SubunitBase
 from .subunits.airplay import Airplay
 from .subunits.bt import Bt
@@ -27,12 +28,47 @@ from .subunits.system import System
 from .subunits.tun import Tun
 from .subunits.uaw import Uaw
 from .subunits.usb import Usb
-from .subunits.zone import Main, Zone2, Zone3, Zone4
+from .subunits.zone import ZONE_SUBUNITS, ZoneBase
 
 logger = logging.getLogger(__name__)
 
 CONNECTION_CHECK_TIMEOUT = 1.5
 
+# Lookup table for how to instantiate a Subunit
+SUBUNIT_FACTORIES: Dict[str, Callable[[YncaConnection], SubunitBase]] = {
+    subunit_class.id: subunit_class
+    for subunit_class in [
+        Airplay,
+        Bt,
+        Dab,
+        Ipod,
+        IpodUsb,
+        Napster,
+        NetRadio,
+        Pandora,
+        Pc,
+        Rhap,
+        Server,
+        Sirius,
+        SiriusIr,
+        SiriusXm,
+        Spotify,
+        System,
+        Tun,
+        Uaw,
+        Usb,
+    ]
+}
+SUBUNIT_FACTORIES.update(
+    {zone_id: functools.partial(ZoneBase, id=zone_id) for zone_id in ZONE_SUBUNITS}
+)
+
+# Time needed to send an AVAIL request for each Subunit and the SYS:VERSION end marker
+# with a large margin on top, large margin is needed in practice on slower/busier systems
+SUBUNIT_AVAILABILITY_CHECK_TIMEOUT = (
+    len(Subunit) + 1
+) * YncaProtocol.COMMAND_SPACING + 10
+
 
 @dataclass
 class YncaConnectionCheckResult:
@@ -67,8 +103,15 @@ class YncaApi:
         """
         self._serial_url = serial_url
         self._connection: Optional[YncaConnection] = None
-        self._available_subunits: Set = set()
-        self._initialized_event = threading.Event()
+        self._available_subunits: Set[str] = set()
+        self._availability_check_done: queue.SimpleQueue = queue.SimpleQueue()
+
+        # Handlers for messages received during the subunit availability check
+        # Keyed on function name so handling a message is a single lookup
+        self._message_handlers: Dict[str, Callable[[str], None]] = {
+            "AVAIL": self._avail_received,
+            "VERSION": self._version_received,
+        }
         self._disconnect_callback = disconnect_callback
         self._communication_log_size = communication_log_size
 
@@ -77,24 +120,21 @@ class YncaApi:
 
     def _detect_available_subunits(self, connection: YncaConnection):
         logger.info("Subunit availability check begin")
-        self._initialized_event.clear()
         connection.register_message_callback(self._protocol_message_received)
 
         # Figure out what subunits are available
-        num_commands_sent_start = connection.num_commands_sent
         self._available_subunits = set()
-        for subunit_id in Subunit:
-            connection.get(subunit_id, "AVAIL")
-
         # Use @SYS:VERSION=? as end marker (even though this is not the SYS subunit)
-        connection.get(Subunit.SYS, "VERSION")
+        connection.get_batch(
+            [(subunit_id, "AVAIL") for subunit_id in Subunit]
+            + [(Subunit.SYS, "VERSION")]
+        )
 
-        # Take command spacing into account and apply large margin
-        # Large margin is needed in practice on slower/busier systems
-        num_commands_sent = connection.num_commands_sent - num_commands_sent_start
-        if not self._initialized_event.wait(
-            2 + (num_commands_sent * (YncaProtocol.COMMAND_SPACING * 5))
-        ):
+        try:
+            self._availability_check_done.get(
+                timeout=SUBUNIT_AVAILABILITY_CHECK_TIMEOUT
+            )
+        except queue.Empty:
             raise YncaInitializationFailedException(
                 f"Subunit availability check failed"
             )
@@ -102,16 +142,6 @@ class YncaApi:
         connection.unregister_message_callback(self._protocol_message_received)
         logger.info("Subunit availability check end")
 
-    def _get_subunit_class(self, subunit_id):
-        subunit_classes = all_subclasses(SubunitBase)
-        for subunit_class in subunit_classes:
-            try:
-                if subunit_class.id == subunit_id:
-                    return subunit_class
-            except AttributeError:  # pragma: no cover
-                # Intermediate Subunit classes like ZoneBase don't have an ID
-                pass
-
     def _initialize_available_subunits(self, connection: YncaConnection):
         # Every receiver has a System subunit
         # It also does not respond to AVAIL=? so it will not end up in _available_subunits
@@ -121,8 +151,8 @@ class YncaApi:
 
         # Initialize detected subunits
         for subunit_id in sorted(self._available_subunits):
-            if subunit_class := self._get_subunit_class(subunit_id):
-                subunit_instance = subunit_class(connection)
+            if subunit_factory := SUBUNIT_FACTORIES.get(subunit_id, None):
+                subunit_instance = subunit_factory(connection)
                 subunit_instance.initialize()
                 self._subunits[subunit_instance.id] = subunit_instance
 
@@ -198,11 +228,22 @@ class YncaApi:
     def _protocol_message_received(
         self, status: YncaProtocolStatus, subunit: str|None, function_: str|None, value: str|None
     ):
-        if function_ == "AVAIL":
-            self._available_subunits.add(subunit)
+        if (
+            status is not YncaProtocolStatus.OK
+            or subunit is None
+            or function_ is None
+        ):
+            return
+
+        if handler := self._message_handlers.get(function_, None):
+            handler(subunit)
+
+    def _avail_received(self, subunit: str):
+        self._available_subunits.add(subunit)
 
-        if subunit == Subunit.SYS and function_ == "VERSION":
-            self._initialized_event.set()
+    def _version_received(self, subunit: str):
+        if subunit == Subunit.SYS:
+            self._availability_check_done.put(None)
 
     def get_communication_log_items(self) -> List[str]:
         """Get a list of logged communication items."""
@@ -226,7 +267,7 @@ class YncaApi:
         YncaApi object should _not_ be reused after being closed!
         """
         # Convert to list to avoid issues when deleting while iterating
-        for id in list(self._subunits.keys()):
+        for id in list(self._subunits):
             subunit = self._subunits.pop(id)
             subunit.close()
         if self._connection:
@@ -258,8 +299,8 @@ class YncaApi:
         return cast(IpodUsb, self._subunits.get(Subunit.IPODUSB, None))
 
     @property
-    def main(self) -> Optional[Main]:
-        return cast(Main, self._subunits.get(Subunit.MAIN, None))
+    def main(self) -> Optional[ZoneBase]:
+        return cast(ZoneBase, self._subunits.get(Subunit.MAIN, None))
 
     @property
     def napster(self) -> Optional[Napster]:
@@ -318,13 +359,13 @@ class YncaApi:
         return cast(Usb, self._subunits.get(Subunit.USB, None))
 
     @property
-    def zone2(self) -> Optional[Zone2]:
-        return cast(Zone2, self._subunits.get(Subunit.ZONE2, None))
+    def zone2(self) -> Optional[ZoneBase]:
+        return cast(ZoneBase, self._subunits.get(Subunit.ZONE2, None))
 
     @property
-    def zone3(self) -> Optional[Zone3]:
-        return cast(Zone3, self._subunits.get(Subunit.ZONE3, None))
+    def zone3(self) -> Optional[ZoneBase]:
+        return cast(ZoneBase, self._subunits.get(Subunit.ZONE3, None))
 
     @property
-    def zone4(self) -> Optional[Zone4]:
-        return cast(Zone4, self._subunits.get(Subunit.ZONE4, None))
+    def zone4(self) -> Optional[ZoneBase]:
+        return cast(ZoneBase, self._subunits.get(Subunit.ZONE4, None))
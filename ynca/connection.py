@@ -3,10 +3,11 @@ from __future__ import annotations
 import logging
 import queue
 import re
+import sys
 import threading
 import time
 from enum import Enum
-from typing import Callable, List, Optional, Set, cast
+from typing import Callable, List, Optional, Sequence, Set, Tuple, cast
 
 import serial  # type: ignore
 import serial.threaded  # type: ignore
@@ -16,6 +17,8 @@ from .helpers import RingBuffer
 
 logger = logging.getLogger(__name__)
 
+MESSAGE_REGEX = re.compile(r"@(?P<subunit>.+?):(?P<function>.+?)=(?P<value>.*)")
+
 
 class LogBuffer(RingBuffer[str]):
     pass
@@ -49,10 +52,12 @@ class YncaProtocol(serial.threaded.LineReader):
         self._disconnect_callback = disconnect_callback
         self._send_queue: queue.Queue
         self._send_thread: threading.Thread
-        self._last_sent_command = None
+        self._last_sent_command: str | None = None
         self.connected = False
         self._keep_alive_pending = False
         self._communication_log_buffer: LogBuffer = LogBuffer(communication_log_size)
+        # Avoids formatting log items for every message when logging is disabled
+        self._communication_log_enabled = communication_log_size > 0
         self.num_commands_sent = 0
 
     def connection_made(self, transport):
@@ -75,7 +80,7 @@ class YncaProtocol(serial.threaded.LineReader):
     def connection_lost(self, exc):
         self.connected = False
 
-        logger.debug("Connection closed/lost %s" % exc)
+        logger.debug("Connection closed/lost %s", exc)
 
         if self._send_queue:
             # There seems to be no way to clear a queue so just read all and add the _EXIT command
@@ -100,17 +105,20 @@ class YncaProtocol(serial.threaded.LineReader):
         value: str | None = None
 
         logger.debug("Recv - %s", line)
-        self._communication_log_buffer.add(f"Received: {line}")
+        if self._communication_log_enabled:
+            self._communication_log_buffer.add(f"Received: {line}")
 
         if line == "@UNDEFINED":
             status = YncaProtocolStatus.UNDEFINED
         elif line == "@RESTRICTED":
             status = YncaProtocolStatus.RESTRICTED
 
-        match = re.match(r"@(?P<subunit>.+?):(?P<function>.+?)=(?P<value>.*)", line)
+        match = MESSAGE_REGEX.match(line)
         if match is not None:
-            subunit = match.group("subunit")
-            function = match.group("function")
+            # Subunit and function names are a small set of strings that get compared
+            # and used for lookups a lot, interning makes those cheaper
+            subunit = sys.intern(match.group("subunit"))
+            function = sys.intern(match.group("function"))
             value = match.group("value")
 
             if (
@@ -142,18 +150,20 @@ class YncaProtocol(serial.threaded.LineReader):
                     self._keep_alive_pending = True
 
                 if not stop:
-                    logger.debug("Send - %s", message)
-                    self._communication_log_buffer.add(f"Send: {message}")
-
-                    self._last_sent_command = message
-                    self.write_line(message)
-                    time.sleep(
-                        self.COMMAND_SPACING
-                    )  # Maintain required command spacing
+                    self._send_line(message)
             except queue.Empty:
                 # To avoid random message being eaten because device goes to sleep, keep it alive
                 self._send_keepalive()
 
+    def _send_line(self, line: str):
+        logger.debug("Send - %s", line)
+        if self._communication_log_enabled:
+            self._communication_log_buffer.add(f"Send: {line}")
+
+        self._last_sent_command = line
+        self.write_line(line)
+        time.sleep(self.COMMAND_SPACING)  # Maintain required command spacing
+
     def raw(self, raw_data: str):
         if self._send_queue:
             self._send_queue.put(raw_data)
@@ -167,6 +177,16 @@ class YncaProtocol(serial.threaded.LineReader):
     def get(self, subunit: str, funcname: str):
         self.put(subunit, funcname, "?")
 
+    def get_batch(self, requests: Sequence[Tuple[str, str]]):
+        """
+        Queue GET requests for multiple (subunit, function) pairs.
+        The requests are sent in the order given.
+        """
+        # Queue each request separately so pending requests can still be
+        # dropped when the connection gets closed or lost
+        for subunit, funcname in requests:
+            self.get(subunit, funcname)
+
     def get_communication_log_items(self) -> List[str]:
         """
         Get a list of logged communication items.
@@ -232,6 +252,7 @@ class YncaConnection:
     ):
         try:
             self._serial = serial.serial_for_url(self._port)
+            self._enable_low_latency_mode(self._serial)
             self._readerthread = serial.threaded.ReaderThread(
                 self._serial,
                 lambda: YncaProtocol(
@@ -248,6 +269,17 @@ class YncaConnection:
         except RuntimeError as e:
             raise YncaConnectionFailed(e)
 
+    @staticmethod
+    def _enable_low_latency_mode(serial_port: serial.Serial):
+        # USB-serial adapters (e.g. FTDI) buffer received data for up to 16ms by default.
+        # Low latency mode reduces that, which speeds up every request/response.
+        # Only available for local serial ports on Linux, so failing is not an error.
+        try:
+            serial_port.set_low_latency_mode(True)
+            logger.debug("Low latency mode enabled")
+        except (AttributeError, NotImplementedError, ValueError) as e:
+            logger.debug("Low latency mode not available: %s", e)
+
     def close(self):
         # Disconnect callback is for unexpected disconnects
         # Don't need it to be called on planned `close()`
@@ -269,6 +301,15 @@ class YncaConnection:
         if self._protocol:
             self._protocol.get(subunit, funcname)
 
+    def get_batch(self, requests: Sequence[Tuple[str, str]]):
+        """
+        Send GET requests for a list of (subunit, function) pairs.
+        The requests are queued in the order given and sent with the
+        normal command spacing, so this is not a pipelined write.
+        """
+        if self._protocol:
+            self._protocol.get_batch(requests)
+
     @property
     def connected(self):
         return self._protocol.connected if self._protocol else False
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from abc import ABC
 from enum import Enum, Flag, auto
 from typing import TYPE_CHECKING, Generic, Type, TypeVar, overload
@@ -61,6 +62,9 @@ class FunctionMixinBase(ABC, Generic[T]):
         """
         self.converter = converter
         self.cmd = cmd
+        # Flag membership checks are relatively slow, so determine once
+        self._supports_get = Cmd.GET in cmd
+        self._supports_put = Cmd.PUT in cmd
         self.initializer = init
         self.no_initialize = no_initialize
 
@@ -82,13 +86,13 @@ class FunctionMixinBase(ABC, Generic[T]):
         if instance is None:
             return self
 
-        if Cmd.GET not in self.cmd:
+        if not self._supports_get:
             raise AttributeError(f"Function {self.name} does not support GET command")
 
         return instance.function_handlers[self.name].value
 
     def __set__(self, instance, value: T):
-        if Cmd.PUT not in self.cmd:
+        if not self._supports_put:
             raise AttributeError(f"Function {self.name} does not support PUT command")
         instance._put(self.name, self.converter.to_str(value))
 
@@ -96,7 +100,9 @@ class FunctionMixinBase(ABC, Generic[T]):
         del instance.function_handlers[self.name]
 
     def __set_name__(self, owner, name):
-        self.name = name.upper() if not self._name_override else self._name_override
+        self.name = sys.intern(
+            name.upper() if not self._name_override else self._name_override
+        )
 
 
 class EnumFunctionMixin(FunctionMixinBase[E], Generic[E]):
@@ -24,13 +24,6 @@ def number_to_string_with_stepsize(value: float, decimals: int, stepsize: float)
     return output
 
 
-# From: https://stackoverflow.com/a/3862957/4124648
-def all_subclasses(cls):
-    return set(cls.__subclasses__()).union(
-        [s for c in cls.__subclasses__() for s in all_subclasses(c)]
-    )
-
-
 T = TypeVar("T")
 
 
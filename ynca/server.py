@@ -33,6 +33,9 @@ YncaCommand = namedtuple("YncaCommand", ["subunit", "function", "value"])
 
 ZONES = ["MAIN", "ZONE2", "ZONE3", "ZONE4"]
 
+# PLAYBACK values that result in a PLAYBACKINFO report
+PLAYBACKINFO_STATES = frozenset(["Play", "Pause", "Stop"])
+
 
 def line_to_command(line):
     match = re.search(r"@(?P<subunit>.+?):(?P<function>.+?)=(?P<value>.*)", line)
@@ -176,7 +179,7 @@ class YncaCommandHandler(socketserver.StreamRequestHandler):
         # Some GET commands result in multple reponses
         if subunit == "SYS" and function == "INPNAME":
             sys_values = self.store._store["SYS"]
-            for key in sys_values.keys():
+            for key in sys_values:
                 if key.startswith("INPNAME") and key != "INPNAME":
                     self.handle_get(subunit, key)
             return
@@ -191,7 +194,7 @@ class YncaCommandHandler(socketserver.StreamRequestHandler):
         elif function == "SCENENAME":
             response_sent = False
             subunit_values = self.store._store[subunit]
-            for key in subunit_values.keys():
+            for key in subunit_values:
                 if (
                     key.startswith("SCENE")
                     and key.endswith("NAME")
@@ -246,7 +249,7 @@ class YncaCommandHandler(socketserver.StreamRequestHandler):
                 function = "PLAYBACKINFO"
 
                 # Not for Fwd or others as they are not a state
-                if value not in ["Play", "Pause", "Stop"]:
+                if value not in PLAYBACKINFO_STATES:
                     return
 
                 # When received on a Zone the response is on INP subunit
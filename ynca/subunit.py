@@ -4,7 +4,7 @@ import logging
 import threading
 from abc import ABC, abstractmethod
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Set
+from typing import Any, Callable, Dict, List, Set
 
 from .connection import YncaConnection, YncaProtocol, YncaProtocolStatus
 from .constants import Subunit
@@ -15,6 +15,10 @@ from .enums import Avail
 logger = logging.getLogger(__name__)
 
 
+# Cache of YNCA functions per SubunitBase subclass, see SubunitBase._get_functions
+_FUNCTIONS_PER_CLASS: Dict[type, List[FunctionMixinBase]] = {}
+
+
 class CommandType(Flag):
     GET = auto()
     PUT = auto()
@@ -52,13 +56,8 @@ class SubunitBase(ABC):
 
         self.function_handlers: Dict[str, YncaFunctionHandler] = {}
 
-        # Note that we need to iterate over the _class_
-        # otherwise the YncaFunction descriptors get/set functions would trigger.
-        # Sort the list to have a deterministic/understandable order for easier testing
-        for attribute_name in sorted(dir(self.__class__)):
-            attribute = getattr(self.__class__, attribute_name)
-            if isinstance(attribute, FunctionMixinBase):
-                self.function_handlers[attribute.name] = YncaFunctionHandler(attribute)
+        for function in self._get_functions():
+            self.function_handlers[function.name] = YncaFunctionHandler(function)
 
         self._initialized = False
         self._initialized_event = threading.Event()
@@ -66,6 +65,25 @@ class SubunitBase(ABC):
         self._connection: YncaConnection | None = connection
         self._connection.register_message_callback(self._protocol_message_received)
 
+    @classmethod
+    def _get_functions(cls) -> List[FunctionMixinBase]:
+        """
+        Get the YNCA functions defined on the class.
+        Scanning the class is relatively expensive and the result does not change,
+        so it is only done once per class.
+        """
+        if (functions := _FUNCTIONS_PER_CLASS.get(cls, None)) is None:
+            # Note that we need to iterate over the _class_
+            # otherwise the YncaFunction descriptors get/set functions would trigger.
+            # Sort the list to have a deterministic/understandable order for easier testing
+            functions = []
+            for attribute_name in sorted(dir(cls)):
+                attribute = getattr(cls, attribute_name)
+                if isinstance(attribute, FunctionMixinBase):
+                    functions.append(attribute)
+            _FUNCTIONS_PER_CLASS[cls] = functions
+        return functions
+
     def initialize(self):
         """
         Initializes the data for the subunit and makes sure to wait until done.
@@ -84,7 +102,9 @@ class SubunitBase(ABC):
         num_commands_sent_start = self._connection.num_commands_sent
 
         # Setup YNCA function handlers
-        initialized_function_names = []
+        # Functions can share an initializer (e.g. METAINFO for ALBUM, ARTIST and SONG)
+        # Collect them in a dict to request each only once, while keeping the order
+        initialize_function_names: Dict[str, None] = {}
         for function_name, handler in self.function_handlers.items():
             if not handler.function.no_initialize:
                 function_name = (
@@ -92,9 +112,8 @@ class SubunitBase(ABC):
                     if handler.function.initializer is not None
                     else function_name
                 )
-                if function_name not in initialized_function_names:
-                    self._get(function_name)
-                    initialized_function_names.append(function_name)
+                initialize_function_names[function_name] = None
+        self._get_many(list(initialize_function_names))
 
         # Use SYS:VERSION as a sync since it is available on all receivers
         self._connection.get(Subunit.SYS, "VERSION")
@@ -151,9 +170,11 @@ class SubunitBase(ABC):
         if self._connection:
             self._connection.put(self.id, function_name, value)
 
-    def _get(self, function_name: str):
+    def _get_many(self, function_names: List[str]):
         if self._connection:
-            self._connection.get(self.id, function_name)
+            self._connection.get_batch(
+                [(self.id, function_name) for function_name in function_names]
+            )
 
     def register_update_callback(self, callback: Callable[[str, Any], None]):
         self._update_callbacks.add(callback)
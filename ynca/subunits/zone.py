@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Type
+from typing import Dict, Type
 
+from ..connection import YncaConnection
 from ..constants import Subunit
 from ..converters import EnumConverter, FloatConverter, MultiConverter, StrConverter
 from ..function import (
@@ -34,12 +36,30 @@ from . import PlaybackFunctionMixin
 
 logger = logging.getLogger(__name__)
 
+ZONE_SUBUNITS = (Subunit.MAIN, Subunit.ZONE2, Subunit.ZONE3, Subunit.ZONE4)
+
+# Converts dB values with a stepsize of 0.5 as used for e.g. volume and tone controls
+half_db_to_str = functools.partial(
+    number_to_string_with_stepsize, decimals=1, stepsize=0.5
+)
+
+# Values for the supported stepsizes other than the default 0.5 dB
+VOL_UP_VALUES: Dict[float, str] = {1: "Up 1 dB", 2: "Up 2 dB", 5: "Up 5 dB"}
+VOL_DOWN_VALUES: Dict[float, str] = {1: "Down 1 dB", 2: "Down 2 dB", 5: "Down 5 dB"}
+
 
 def raiser(ex: Type[Exception]):
     raise ex
 
 
 class ZoneBase(PlaybackFunctionMixin, SubunitBase):
+    """
+    Zone subunit. The zones only differ in their id, so all zones are instances of this class.
+
+    Create a zone with `ZoneBase(connection, id=Subunit.MAIN)`, valid ids are
+    MAIN, ZONE2, ZONE3 and ZONE4. This replaces the former Main, Zone2, Zone3
+    and Zone4 classes, use the `id` attribute to tell zones apart.
+    """
 
     # BASIC gets a lot of attribute like PWR, SLEEP, VOL, MUTE, INP, STRAIGHT, ENHANCER, SOUNDPRG and more
     # Use it to significantly reduce the amount of commands to send
@@ -48,22 +68,16 @@ class ZoneBase(PlaybackFunctionMixin, SubunitBase):
     enhancer = EnumFunctionMixin[Enhancer](Enhancer)
     hdmiout = EnumFunctionMixin[HdmiOut](HdmiOut)
     hpbass = FloatFunctionMixin(
-        converter=FloatConverter(
-            to_str=lambda v: number_to_string_with_stepsize(v, 1, 0.5)
-        ),
+        converter=FloatConverter(to_str=half_db_to_str),
     )
     hptreble = FloatFunctionMixin(
-        converter=FloatConverter(
-            to_str=lambda v: number_to_string_with_stepsize(v, 1, 0.5)
-        ),
+        converter=FloatConverter(to_str=half_db_to_str),
     )
     initvollvl = EnumOrFloatFunctionMixin[InitVolLvl](
         InitVolLvl,
         MultiConverter(
             [
-                FloatConverter(
-                    to_str=lambda v: number_to_string_with_stepsize(v, 1, 0.5)
-                ),
+                FloatConverter(to_str=half_db_to_str),
                 EnumConverter[InitVolLvl](InitVolLvl),
             ]
         ),
@@ -101,14 +115,10 @@ class ZoneBase(PlaybackFunctionMixin, SubunitBase):
     sleep = EnumFunctionMixin[Sleep](Sleep)
     soundprg = EnumFunctionMixin[SoundPrg](SoundPrg, init="BASIC")
     spbass = FloatFunctionMixin(
-        converter=FloatConverter(
-            to_str=lambda v: number_to_string_with_stepsize(v, 1, 0.5)
-        ),
+        converter=FloatConverter(to_str=half_db_to_str),
     )
     sptreble = FloatFunctionMixin(
-        converter=FloatConverter(
-            to_str=lambda v: number_to_string_with_stepsize(v, 1, 0.5)
-        ),
+        converter=FloatConverter(to_str=half_db_to_str),
     )
     straight = EnumFunctionMixin[Straight](Straight, init="BASIC")
     threedcinema = EnumFunctionMixin[ThreeDeeCinema](
@@ -116,13 +126,17 @@ class ZoneBase(PlaybackFunctionMixin, SubunitBase):
     )
     twochdecoder = EnumFunctionMixin[TwoChDecoder](TwoChDecoder, name_override="2CHDECODER")
     vol = FloatFunctionMixin(
-        converter=FloatConverter(
-            to_str=lambda v: number_to_string_with_stepsize(v, 1, 0.5)
-        ),
+        converter=FloatConverter(to_str=half_db_to_str),
         init="BASIC",
     )
     zonename = StrFunctionMixin(converter=StrConverter(min_len=0, max_len=9))
 
+    def __init__(self, connection: YncaConnection, id: Subunit) -> None:
+        if id not in ZONE_SUBUNITS:
+            raise ValueError(f"{id} is not a zone subunit")
+        self.id = id
+        super().__init__(connection)
+
     def scene(self, scene_id: int | str):
         """Recall a scene"""
         self._put("SCENE", f"Scene {scene_id}")
@@ -132,33 +146,11 @@ class ZoneBase(PlaybackFunctionMixin, SubunitBase):
         Increase the volume with given stepsize.
         Supported stepsizes are: 0.5, 1, 2 and 5
         """
-        value = "Up"
-        if step_size in [1, 2, 5]:
-            value = "Up {} dB".format(step_size)
-        self._put("VOL", value)
+        self._put("VOL", VOL_UP_VALUES.get(step_size, "Up"))
 
     def vol_down(self, step_size: float = 0.5):
         """
         Decrease the volume with given stepsize.
         Supported stepsizes are: 0.5, 1, 2 and 5
         """
-        value = "Down"
-        if step_size in [1, 2, 5]:
-            value = "Down {} dB".format(step_size)
-        self._put("VOL", value)
-
-
-class Main(ZoneBase):
-    id = Subunit.MAIN
-
-
-class Zone2(ZoneBase):
-    id = Subunit.ZONE2
-
-
-class Zone3(ZoneBase):
-    id = Subunit.ZONE3
-
-
-class Zone4(ZoneBase):
-    id = Subunit.ZONE4
+        self._put("VOL", VOL_DOWN_VALUES.get(step_size, "Down"))